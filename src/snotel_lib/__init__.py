@@ -15,12 +15,14 @@ from .io import (
     get_metloom_station_cache_path,
     read_validated_csv,
     read_validated_parquet,
+    write_cache_parquet,
 )
 from .schemas import (
     AllSnotelDataSchema,
     SnotelDataSchema,
     StationMetadataSchema,
     cast_to_schema,
+    cast_to_schema_lazy,
     dtypes_from_schema,
 )
 
@@ -33,6 +35,7 @@ __all__ = [
     "StationMetadataSchema",
     "accumulate_precip_by_water_year",
     "cast_to_schema",
+    "cast_to_schema_lazy",
     "compute_consistency_metrics",
     "compute_diff_metrics",
     "compute_live_z_score",
@@ -46,4 +49,5 @@ __all__ = [
     "get_top_bot",
     "read_validated_csv",
     "read_validated_parquet",
+    "write_cache_parquet",
 ]
@@ -1,6 +1,9 @@
 import datetime as dt
+import typing
 
 import geopandas as gpd
+import numpy as np
+import pandas as pd
 import polars as pl
 
 from snotel_lib.schemas import AllSnotelDataSchema, SnotelDataSchema, StationMetadataSchema
@@ -62,7 +65,9 @@ def get_top_bot(
     }
 
 
-def accumulate_precip_by_water_year(df: pl.DataFrame, is_all_stations: bool = False) -> pl.DataFrame:
+def accumulate_precip_by_water_year[FrameT: (pl.DataFrame, pl.LazyFrame)](
+    df: FrameT, is_all_stations: bool = False
+) -> FrameT:
     """
     SNOTEL naturally uses accumulated precipitation by water year (starting Oct 1).
     This function computes that cumulative sum from daily precipitation values.
@@ -72,7 +77,9 @@ def accumulate_precip_by_water_year(df: pl.DataFrame, is_all_stations: bool = Fa
     ).cast(pl.Int32)
     partition_cols = [AllSnotelDataSchema.station_id, "water_year"] if is_all_stations else ["water_year"]
 
-    return (
+    # Each frame type's methods return that same type, which the checker cannot see through the union
+    return typing.cast(
+        FrameT,
         df.with_columns(water_year=water_year_expr)
         .with_columns(
             pl.col(SnotelDataSchema.precip_m)
@@ -82,17 +89,19 @@ def accumulate_precip_by_water_year(df: pl.DataFrame, is_all_stations: bool = Fa
             .cast(pl.Float32)
             .alias(SnotelDataSchema.precip_m)
         )
-        .drop("water_year")
+        .drop("water_year"),
     )
 
 
 def get_min_and_max_rows(station_metadata: gpd.GeoDataFrame, column_name: str) -> gpd.GeoDataFrame:
     """Find the rows with the minimum and maximum values in a specific column for stations active in the last 2 days."""
-    t_minus_two = dt.date.today() - dt.timedelta(days=2)
-    current_stations = station_metadata[
-        (station_metadata["end_date"] > t_minus_two) & (station_metadata["end_date"] <= dt.date.today())
-    ].index.unique()
-    current_stations_metadata = station_metadata.loc[current_stations]
-    max_column_idx = current_stations_metadata[column_name].dropna().idxmax()
-    min_column_idx = current_stations_metadata[column_name].dropna().idxmin()
-    return current_stations_metadata.loc[[max_column_idx, min_column_idx]]
+    today = pd.Timestamp(dt.date.today())
+    t_minus_two = pd.Timestamp(dt.date.today() - dt.timedelta(days=2))
+    # to_datetime is a no-op for datetime64 columns and still accepts object date columns
+    end_dates = pd.to_datetime(station_metadata["end_date"])
+    is_current = ((end_dates > t_minus_two) & (end_dates <= today)).to_numpy()
+    column = station_metadata[column_name]
+    # isna() also catches NaT, so the same single mask works for numeric and datetime columns
+    positions = np.flatnonzero(is_current & column.notna().to_numpy())
+    values = column.to_numpy()[positions]
+    return station_metadata.iloc[[positions[values.argmax()], positions[values.argmin()]]]
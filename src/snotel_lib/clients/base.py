@@ -1,17 +1,21 @@
 import abc
 import logging
+import time
 import typing
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import polars as pl
 from pandera.typing.geopandas import GeoDataFrame
 from pandera.typing.polars import DataFrame
 
-from ..schemas import AllSnotelDataSchema, SnotelDataSchema, StationMetadataSchema
+from ..constants import CACHE_SCHEMA_VERSION, MAX_CONCURRENT_REQUESTS
+from ..schemas import AllSnotelDataSchema, SnotelDataSchema, StationMetadataSchema, dtypes_from_schema
 
 logger = logging.getLogger(__name__)
 
+SECONDS_PER_DAY = 86400.0
+
 T = typing.TypeVar("T")
 
 
@@ -23,6 +27,8 @@ class BaseSnotelClient(abc.ABC):
         from ..io import get_default_cache_dir
 
         self.cache_dir = cache_dir or get_default_cache_dir()
+        # In-process copies of cache files, keyed by path and tagged with the file mtime they were read at
+        self._memo: dict[Path, tuple[float, typing.Any]] = {}
 
     @abc.abstractmethod
     def get_stations_metadata(self, force_update: bool = False) -> GeoDataFrame[StationMetadataSchema]:
@@ -57,6 +63,38 @@ class BaseSnotelClient(abc.ABC):
         """
         pass
 
+    def get_station_data_many(
+        self,
+        station_ids: list[str],
+        start_date: str | None = None,
+        end_date: str | None = None,
+        force_update: bool = False,
+        max_workers: int = MAX_CONCURRENT_REQUESTS,
+    ) -> dict[str, DataFrame[SnotelDataSchema]]:
+        """Fetch daily SNOTEL data for several stations concurrently.
+
+        Cache misses are fetched on a thread pool so their network round-trips overlap
+        instead of running one after another.
+
+        Args:
+            station_ids: Station identifiers to fetch.
+            start_date: Optional start date filtering (format 'YYYY-MM-DD').
+            end_date: Optional end date filtering (format 'YYYY-MM-DD').
+            force_update: If True, bypass caching and force fresh downloads.
+            max_workers: Maximum number of stations fetched at once.
+
+        Returns:
+            A dict mapping each distinct station id to a Polars DataFrame conforming to SnotelDataSchema.
+        """
+        # Duplicate ids would race to write the same cache file
+        unique_ids = list(dict.fromkeys(station_ids))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(
+                lambda station_id: self.get_station_data(station_id, start_date, end_date, force_update),
+                unique_ids,
+            )
+            return dict(zip(unique_ids, results, strict=True))
+
     @abc.abstractmethod
     def get_all_station_data(self, force_update: bool = False) -> DataFrame[AllSnotelDataSchema]:
         """Fetch combined daily SNOTEL data for all stations.
@@ -71,10 +109,10 @@ class BaseSnotelClient(abc.ABC):
 
     def _is_cache_valid(self, path: Path, days: int) -> bool:
         """Return True if a cached file exists and is younger than `days` days."""
-        if not path.exists():
+        try:
+            return time.time() - path.stat().st_mtime < days * SECONDS_PER_DAY
+        except FileNotFoundError:
             return False
-        mtime = datetime.fromtimestamp(path.stat().st_mtime)
-        return datetime.now() - mtime < timedelta(days=days)
 
     def _read_cache_if_valid(
         self,
@@ -83,6 +121,7 @@ class BaseSnotelClient(abc.ABC):
         force_update: bool,
         read_func: typing.Callable[[Path], T],
         log_label: str,
+        memoize: bool = False,
     ) -> T | None:
         """Read and return cached data if the cache is still valid; otherwise return None.
 
@@ -92,20 +131,61 @@ class BaseSnotelClient(abc.ABC):
             force_update: If True, treat the cache as stale regardless of age.
             read_func: Callable that accepts a Path and returns the cached data object.
             log_label: Human-readable label used in the cache-hit log message.
+            memoize: If True, keep the result in memory and reuse it while the file is unchanged.
 
         Returns:
             The cached data if valid, or None on a cache miss.
         """
         if force_update or not self._is_cache_valid(cache_path, max_days):
             return None
+
+        if memoize:
+            memoized = self._memo.get(cache_path)
+            if memoized is not None and memoized[0] == cache_path.stat().st_mtime:
+                logger.info(f"Cache hit — reusing in-memory {log_label} for {cache_path}")
+                return memoized[1]
+
         logger.info(f"Cache hit — reading {log_label} from {cache_path}")
-        return read_func(cache_path)
+        data = read_func(cache_path)
+        if memoize:
+            self._memoize(cache_path, data)
+        return data
+
+    def _memoize(self, cache_path: Path, data: typing.Any) -> None:
+        """Keep `data` in memory as the contents of `cache_path` at its current mtime."""
+        self._memo[cache_path] = (cache_path.stat().st_mtime, data)
+
+    def _schema_version_stamp(self, cache_path: Path) -> str:
+        """Identify the current schema version together with the exact cache file it describes."""
+        stat = cache_path.stat()
+        return f"{CACHE_SCHEMA_VERSION}:{stat.st_mtime_ns}:{stat.st_size}"
+
+    def _write_schema_version(self, cache_path: Path) -> None:
+        """Record the schema version of a cache we just validated in a sidecar file."""
+        cache_path.with_suffix(".ver").write_text(self._schema_version_stamp(cache_path))
+
+    def _has_current_schema_version(self, cache_path: Path) -> bool:
+        """Return True if the cache's sidecar says this very file was validated against the current schema.
+
+        A cache rewritten without updating the sidecar no longer matches its mtime/size and is re-validated.
+        """
+        try:
+            return cache_path.with_suffix(".ver").read_text() == self._schema_version_stamp(cache_path)
+        except FileNotFoundError:
+            return False
+
+    def _scan_station_cache(self, cache_path: Path) -> pl.LazyFrame:
+        """Lazily scan a processed station cache so projection and date predicates are pushed into the reader."""
+        return pl.scan_parquet(cache_path).select(list(dtypes_from_schema(SnotelDataSchema)))
 
-    def _filter_and_process(self, df: pl.DataFrame, start_date: str | None, end_date: str | None) -> pl.DataFrame:
-        """Apply date filtering to an already-processed dataframe."""
+    def _filter_and_process(
+        self, df: pl.DataFrame | pl.LazyFrame, start_date: str | None, end_date: str | None
+    ) -> pl.DataFrame:
+        """Apply date filtering to an already-processed dataframe as a single lazy query."""
+        lf = df.lazy()
         if start_date:
-            df = df.filter(pl.col(SnotelDataSchema.datetime) >= pl.lit(start_date).cast(pl.Date))
+            lf = lf.filter(pl.col(SnotelDataSchema.datetime) >= pl.lit(start_date).str.to_date())
         if end_date:
-            df = df.filter(pl.col(SnotelDataSchema.datetime) <= pl.lit(end_date).cast(pl.Date))
+            lf = lf.filter(pl.col(SnotelDataSchema.datetime) <= pl.lit(end_date).str.to_date())
 
-        return df
+        return lf.collect()
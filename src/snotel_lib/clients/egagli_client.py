@@ -1,30 +1,38 @@
+import contextlib
 import io
 import logging
 import lzma
 import tarfile
 import time
 import typing
+from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import geopandas as gpd
+import pandas as pd
 import polars as pl
+import pyarrow as pa
 import requests
+import urllib3
 from pandera.typing.geopandas import GeoDataFrame
 from pandera.typing.polars import DataFrame
+from requests.adapters import HTTPAdapter
 
 from ..calculation import accumulate_precip_by_water_year
-from ..constants import METADATA_CACHE_DAYS, STATION_CACHE_DAYS
+from ..constants import MAX_CONCURRENT_REQUESTS, METADATA_CACHE_DAYS, STATION_CACHE_DAYS
 from ..io import (
     get_all_station_data_cache_path,
     get_default_cache_dir,
     get_egagli_station_cache_path,
     get_metadata_cache_path,
+    write_cache_parquet,
 )
 from ..schemas import (
     AllSnotelDataSchema,
     SnotelDataSchema,
     StationMetadataSchema,
-    cast_to_schema,
+    cast_to_schema_lazy,
 )
 from .base import BaseSnotelClient
 
@@ -52,6 +60,8 @@ METADATA_COLUMN_MAP = {
     "csvData": StationMetadataSchema.csv_data,
 }
 
+CSV_NULL_VALUES = ["", "NaN", "NA", "null"]
+
 STATION_DATA_COLUMN_MAP = {
     "WTEQ": SnotelDataSchema.swe_m,
     "SNWD": SnotelDataSchema.snow_depth_m,
@@ -61,20 +71,40 @@ STATION_DATA_COLUMN_MAP = {
     "TAVG": SnotelDataSchema.tavg_c,
 }
 
+# Measurement columns are always numeric; fixing their dtype up front keeps mostly-empty
+# columns from being inferred as strings and integer-looking prefixes from rejecting decimals later.
+RAW_STATION_DATA_DTYPES = dict.fromkeys(STATION_DATA_COLUMN_MAP, pl.Float64)
+
 
 class EgagliClient(BaseSnotelClient):
-    def __init__(self, cache_dir: Path | None = None):
+    def __init__(self, cache_dir: Path | None = None, zstd_mirror_url: str | None = None):
+        """Initialize the client.
+
+        Args:
+            cache_dir: Optional custom cache directory.
+            zstd_mirror_url: Optional URL of a ``.tar.zst`` mirror of the all-stations archive. zstd
+                decompresses several times faster than the upstream LZMA; requires the ``zstd`` extra (``zstandard``).
+                Falls back to the upstream ``.tar.lzma`` if the mirror or the package is unavailable.
+        """
         super().__init__(cache_dir)
         self.cache_dir = cache_dir or get_default_cache_dir()
+        self.zstd_mirror_url = zstd_mirror_url
+        # One pooled session so repeated and concurrent fetches reuse TCP/TLS connections.
+        # requests already advertises gzip/deflate and transparently decodes compressed responses.
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_maxsize=MAX_CONCURRENT_REQUESTS))
 
     def get_stations_metadata(self, force_update: bool = False) -> GeoDataFrame[StationMetadataSchema]:
         """Fetch metadata for all SNOTEL stations, with caching."""
         start_time = time.perf_counter()
         cache_path = get_metadata_cache_path(self.cache_dir)
 
-        cached = self._read_cache_if_valid(cache_path, METADATA_CACHE_DAYS, force_update, gpd.read_parquet, "metadata")
+        cached = self._read_cache_if_valid(
+            cache_path, METADATA_CACHE_DAYS, force_update, self._read_metadata_cache, "metadata", memoize=True
+        )
         if cached is not None:
-            res = typing.cast(GeoDataFrame[StationMetadataSchema], StationMetadataSchema.validate(cached))
+            # Shallow copy so callers adding or replacing columns don't alter the memoized frame
+            res = typing.cast(GeoDataFrame[StationMetadataSchema], cached.copy(deep=False))
             logger.info(
                 f"Metadata retrieval took {time.perf_counter() - start_time:.2f}s (cache hit, {len(res)} stations)"
             )
@@ -98,7 +128,7 @@ class EgagliClient(BaseSnotelClient):
         cache_path = get_egagli_station_cache_path(self.cache_dir, station_id)
 
         cached = self._read_cache_if_valid(
-            cache_path, STATION_CACHE_DAYS, force_update, pl.read_parquet, f"station data for {station_id}"
+            cache_path, STATION_CACHE_DAYS, force_update, self._scan_station_cache, f"station data for {station_id}"
         )
         if cached is not None:
             res = self._filter_and_process(cached, start_date, end_date)
@@ -119,21 +149,16 @@ class EgagliClient(BaseSnotelClient):
         cache_path = get_all_station_data_cache_path(self.cache_dir)
 
         cached = self._read_cache_if_valid(
-            cache_path, STATION_CACHE_DAYS, force_update, pl.read_parquet, "combined station data"
+            cache_path, STATION_CACHE_DAYS, force_update, pl.read_parquet, "combined station data", memoize=True
         )
         if cached is not None:
             logger.info(
                 f"Combined data retrieval took {time.perf_counter() - start_time:.2f}s (cache hit, {len(cached)} rows, {cached.estimated_size('mb'):.1f} MB)"
             )
-            return typing.cast(DataFrame[AllSnotelDataSchema], cached)
+            # Clone (shares the column buffers) so in-place column edits don't alter the memoized frame
+            return typing.cast(DataFrame[AllSnotelDataSchema], cached.clone())
 
-        logger.info(f"Fetching combined data from internet: {EGAGLI_ALL_STATIONS_TAR_URL}")
-
-        response = requests.get(EGAGLI_ALL_STATIONS_TAR_URL, stream=True)
-        response.raise_for_status()
-
-        dfs = self._parse_tar_to_dataframes(response.content)
-        combined_df = pl.concat(dfs, how="vertical_relaxed")
+        combined_df = self._parse_station_csvs(self._download_station_csvs())
 
         # Add station_id if not already correctly cast
         if AllSnotelDataSchema.station_id in combined_df.columns:
@@ -141,24 +166,39 @@ class EgagliClient(BaseSnotelClient):
 
         combined_df = self._process_raw_polars_data(combined_df, is_all_stations=True)
 
-        combined_df.write_parquet(cache_path)
+        # Already sorted by (station_id, datetime), so row-group statistics stay tight on both
+        write_cache_parquet(combined_df, cache_path)
+        self._memoize(cache_path, combined_df)
         logger.info(
             f"Combined data retrieval took {time.perf_counter() - start_time:.2f}s "
             f"(cache miss, {len(combined_df)} rows, {combined_df.estimated_size('mb'):.1f} MB)"
         )
-        return typing.cast(DataFrame[AllSnotelDataSchema], combined_df)
+        return typing.cast(DataFrame[AllSnotelDataSchema], combined_df.clone())
+
+    def _read_metadata_cache(self, cache_path: Path) -> GeoDataFrame[StationMetadataSchema]:
+        cached = gpd.read_parquet(cache_path)
+        # Skip re-validating a cache we validated and wrote ourselves under the current schema
+        if not self._has_current_schema_version(cache_path):
+            cached = StationMetadataSchema.validate(cached)
+        return typing.cast(GeoDataFrame[StationMetadataSchema], cached)
 
     def _fetch_and_cache_metadata(self, cache_path: Path) -> GeoDataFrame[StationMetadataSchema]:
         logger.info(f"Fetching metadata from internet: {EGAGLI_GEOJSON_URL}")
-        response = requests.get(EGAGLI_GEOJSON_URL)
+        response = self._session.get(EGAGLI_GEOJSON_URL)
         response.raise_for_status()
 
-        df = gpd.read_file(io.BytesIO(response.content))
+        # pyogrio's Arrow path reads all features in one columnar call instead of iterating them in Python
+        df = gpd.read_file(io.BytesIO(response.content), engine="pyogrio", use_arrow=True)
         df = df.rename(columns=METADATA_COLUMN_MAP)
+        # datetime64 rather than object dates so downstream date comparisons stay vectorized
+        for col in (StationMetadataSchema.begin_date, StationMetadataSchema.end_date):
+            df[col] = pd.to_datetime(df[col], errors="coerce")
 
         validated_df = typing.cast(GeoDataFrame[StationMetadataSchema], StationMetadataSchema.validate(df))
         validated_df.to_parquet(cache_path)
-        return validated_df
+        self._write_schema_version(cache_path)
+        self._memoize(cache_path, validated_df)
+        return typing.cast(GeoDataFrame[StationMetadataSchema], validated_df.copy(deep=False))
 
     def _fetch_and_cache_station_data(
         self, station_id: str, cache_path: Path, start_date: str | None, end_date: str | None
@@ -166,58 +206,161 @@ class EgagliClient(BaseSnotelClient):
         url = EGAGLI_STATION_CSV_BASE.format(station_id=station_id)
         logger.info(f"Fetching data for {station_id} from internet: {url}")
 
-        response = requests.get(url)
+        response = self._session.get(url)
         response.raise_for_status()
 
         df = pl.read_csv(
-            io.BytesIO(response.content),
+            response.content,
             try_parse_dates=True,
-            null_values=["", "NaN", "NA", "null"],
+            null_values=CSV_NULL_VALUES,
         )
 
+        # Accumulated precip needs the full record, so only the date filter can run after caching.
         df = self._process_raw_polars_data(df)
-        df.write_parquet(cache_path)
+        write_cache_parquet(df, cache_path)
 
         return self._filter_and_process(df, start_date, end_date)
 
     def _process_raw_polars_data(
         self, df: pl.DataFrame, is_all_stations: bool = False
     ) -> pl.DataFrame:  # returns AllSnotelDataSchema when is_all_stations=True
-        """Rename columns from source names, cast to schema dtypes, validate, and compute accumulated precip."""
+        """Rename columns from source names, cast to schema dtypes, compute accumulated precip, and validate."""
         schema = AllSnotelDataSchema if is_all_stations else SnotelDataSchema
-        df = cast_to_schema(df, schema, column_map=STATION_DATA_COLUMN_MAP)
-
         sort_cols = (
             [AllSnotelDataSchema.station_id, SnotelDataSchema.datetime]
             if is_all_stations
             else [SnotelDataSchema.datetime]
         )
-        df = df.sort(sort_cols)
-        return accumulate_precip_by_water_year(df, is_all_stations=is_all_stations)
-
-    def _filter_and_process(self, df: pl.DataFrame, start_date: str | None, end_date: str | None) -> pl.DataFrame:
-        """Ensure column naming and apply date filtering."""
-        df = self._process_raw_polars_data(df, is_all_stations=False)
-        return super()._filter_and_process(df, start_date, end_date)
-
-    def _parse_tar_to_dataframes(self, content: bytes) -> list[pl.DataFrame]:
-        """Extract CSV files from tar.lzma into a list of DataFrames."""
-        dfs = []
-        with lzma.open(io.BytesIO(content)) as lzma_file:
-            with tarfile.open(fileobj=lzma_file, mode="r:") as tar:
-                for member in tar.getmembers():
-                    if member.isfile() and member.name.endswith(".csv"):
-                        station_id = member.name.split("/")[-1].replace(".csv", "")
-                        f = tar.extractfile(member)
-                        if f:
-                            csv_bytes = f.read()
-                            if not csv_bytes:
-                                continue
-                            df = pl.read_csv(
-                                csv_bytes,
-                                try_parse_dates=True,
-                                null_values=["", "NaN", "NA", "null"],
-                            )
-                            df = df.with_columns(pl.lit(station_id).alias(AllSnotelDataSchema.station_id))
-                            dfs.append(df)
-        return dfs
+
+        # Built as one lazy query so the rename/cast projections fuse with the precip window pass
+        lf = cast_to_schema_lazy(df.lazy(), schema, column_map=STATION_DATA_COLUMN_MAP).sort(sort_cols)
+        lf = accumulate_precip_by_water_year(lf, is_all_stations=is_all_stations)
+        return typing.cast(pl.DataFrame, schema.validate(lf.collect()))
+
+    def _download_station_csvs(self) -> list[tuple[str, bytes]]:
+        """Download the all-stations archive and return the raw bytes of each station's CSV.
+
+        Prefers the zstd mirror when one is configured. If the mirror cannot be fetched or its body
+        fails to decompress or untar, falls back to the upstream tar.lzma.
+        """
+        if self.zstd_mirror_url is not None:
+            try:
+                import zstandard
+            except ImportError as e:
+                logger.warning(f"zstandard not installed, falling back to {EGAGLI_ALL_STATIONS_TAR_URL}: {e}")
+            else:
+                try:
+                    with self._open_tar_stream(
+                        self.zstd_mirror_url, zstandard.ZstdDecompressor().stream_reader
+                    ) as tar_stream:
+                        return self._extract_station_csvs(tar_stream)
+                # The body is read through response.raw, so mid-download resets and read timeouts
+                # surface as urllib3 errors rather than requests exceptions
+                except (
+                    requests.RequestException,
+                    urllib3.exceptions.HTTPError,
+                    zstandard.ZstdError,
+                    tarfile.TarError,
+                ) as e:
+                    logger.warning(f"zstd mirror unusable, falling back to {EGAGLI_ALL_STATIONS_TAR_URL}: {e}")
+
+        with self._open_tar_stream(EGAGLI_ALL_STATIONS_TAR_URL, lzma.open) as tar_stream:
+            return self._extract_station_csvs(tar_stream)
+
+    @contextlib.contextmanager
+    def _open_tar_stream(
+        self, url: str, decompress: typing.Callable[[typing.BinaryIO], typing.Any]
+    ) -> Generator[typing.BinaryIO]:
+        """Stream `url` through `decompress` and yield the decompressed tar stream.
+
+        Decompression and tar iteration overlap with the download instead of buffering it.
+        The decompressor and the HTTP response are both closed on exit, releasing the connection.
+        """
+        with contextlib.ExitStack() as stack:
+            response = self._fetch_stream(url)
+            stack.callback(response.close)
+            yield typing.cast(typing.BinaryIO, stack.enter_context(decompress(response.raw)))
+
+    def _fetch_stream(self, url: str) -> requests.Response:
+        """Issue a streaming GET whose raw body is decoded of any transfer compression."""
+        logger.info(f"Fetching combined data from internet: {url}")
+        response = self._session.get(url, stream=True)
+        try:
+            response.raise_for_status()
+        except requests.HTTPError:
+            response.close()
+            raise
+        response.raw.decode_content = True
+        return response
+
+    def _parse_station_csvs(self, station_csvs: list[tuple[str, bytes]]) -> pl.DataFrame:
+        """Parse the raw per-station CSVs extracted from the archive into a single DataFrame."""
+        combined_csv = self._concat_station_csvs(station_csvs)
+        if combined_csv is not None:
+            # One large parse amortizes schema inference and uses all of Polars' CSV threads
+            return pl.read_csv(
+                combined_csv,
+                try_parse_dates=True,
+                null_values=CSV_NULL_VALUES,
+                schema_overrides=RAW_STATION_DATA_DTYPES,
+            )
+
+        # Headers differ between stations; parse each file separately and align columns by name.
+        # Polars releases the GIL while parsing, so threads scale with cores here
+        with ThreadPoolExecutor() as executor:
+            dfs = list(executor.map(lambda item: self._read_station_csv(*item), station_csvs))
+
+        # Arrow concatenates by reference to the existing buffers; only differing schemas are unified
+        tables = [df.to_arrow() for df in dfs]
+        return typing.cast(pl.DataFrame, pl.from_arrow(pa.concat_tables(tables, promote_options="permissive")))
+
+    def _extract_station_csvs(self, tar_stream: typing.BinaryIO) -> list[tuple[str, bytes]]:
+        """Read the raw bytes of every non-empty station CSV in the tar stream in a single pass."""
+        station_csvs = []
+        # Streaming mode: the source is not seekable, so members are read in order as they arrive
+        with tarfile.open(fileobj=tar_stream, mode="r|") as tar:
+            for member in tar:
+                if member.isfile() and member.name.endswith(".csv"):
+                    station_id = member.name.split("/")[-1].replace(".csv", "")
+                    f = tar.extractfile(member)
+                    if f:
+                        csv_bytes = f.read()
+                        if csv_bytes:
+                            station_csvs.append((station_id, csv_bytes))
+        return station_csvs
+
+    def _concat_station_csvs(self, station_csvs: list[tuple[str, bytes]]) -> bytes | None:
+        """Join per-station CSVs into one CSV with a trailing station_id column.
+
+        Returns None when the files do not all share the same header.
+        """
+        header = None
+        parts = []
+        for station_id, csv_bytes in station_csvs:
+            file_header, _, body = csv_bytes.replace(b"\r\n", b"\n").partition(b"\n")
+            if header is None:
+                header = file_header
+                parts.append(header + b"," + AllSnotelDataSchema.station_id.encode() + b"\n")
+            elif file_header != header:
+                return None
+
+            # Blank lines are dropped, as read_csv would; tagging them would shift the id into a data column.
+            # Collapsed with bytes.replace so the whole body is still tagged in C rather than row by row
+            while b"\n\n" in body:
+                body = body.replace(b"\n\n", b"\n")
+            body = body.strip(b"\n")
+            if body:
+                row_suffix = b"," + station_id.encode() + b"\n"
+                parts.append(body.replace(b"\n", row_suffix) + row_suffix)
+
+        return b"".join(parts) if header is not None else None
+
+    def _read_station_csv(self, station_id: str, csv_bytes: bytes) -> pl.DataFrame:
+        """Parse one station's raw CSV and tag it with its station id."""
+        df = pl.read_csv(
+            csv_bytes,
+            try_parse_dates=True,
+            null_values=CSV_NULL_VALUES,
+            schema_overrides=RAW_STATION_DATA_DTYPES,
+        )
+        return df.with_columns(pl.lit(station_id).alias(AllSnotelDataSchema.station_id))
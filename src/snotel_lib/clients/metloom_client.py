@@ -6,13 +6,11 @@ from pathlib import Path
 
 import polars as pl
 from dateutil.relativedelta import relativedelta
-from metloom.pointdata import SnotelPointData
-from metloom.variables import SnotelVariables
 from pandera.typing.geopandas import GeoDataFrame
 from pandera.typing.polars import DataFrame
 
 from ..constants import STATION_CACHE_DAYS
-from ..io import get_metloom_station_cache_path
+from ..io import get_metloom_station_cache_path, write_cache_parquet
 from ..schemas import (
     AllSnotelDataSchema,
     SnotelDataSchema,
@@ -37,12 +35,18 @@ STATION_DATA_COLUMN_MAP = {
 class MetloomClient(BaseSnotelClient):
     """Client for fetching SNOTEL data directly via the Metloom library (NRCS AWDB API)."""
 
-    def get_stations_metadata(self, force_update: bool = False) -> GeoDataFrame[StationMetadataSchema]:
-        """Fetch metadata for all SNOTEL stations. Uses the fast egagli metadata index since AWDB SOAP is slow for bulk metadata."""
+    def __init__(self, cache_dir: Path | None = None):
+        """Initialize the client, optionally with a custom cache directory."""
         from .egagli_client import EgagliClient
 
+        super().__init__(cache_dir)
+        # Kept for the client's lifetime so its in-process memo and pooled session are reused across calls
+        self._metadata_client = EgagliClient(self.cache_dir)
+
+    def get_stations_metadata(self, force_update: bool = False) -> GeoDataFrame[StationMetadataSchema]:
+        """Fetch metadata for all SNOTEL stations. Uses the fast egagli metadata index since AWDB SOAP is slow for bulk metadata."""
         logger.info("Delegating metadata fetch to EgagliClient (fast GeoJSON index).")
-        return EgagliClient(self.cache_dir).get_stations_metadata(force_update=force_update)
+        return self._metadata_client.get_stations_metadata(force_update=force_update)
 
     def get_station_data(
         self,
@@ -56,7 +60,7 @@ class MetloomClient(BaseSnotelClient):
         cache_path = get_metloom_station_cache_path(self.cache_dir, station_id)
 
         cached = self._read_cache_if_valid(
-            cache_path, STATION_CACHE_DAYS, force_update, pl.read_parquet, f"station data for {station_id}"
+            cache_path, STATION_CACHE_DAYS, force_update, self._scan_station_cache, f"station data for {station_id}"
         )
         if cached is not None:
             res = super()._filter_and_process(cached, start_date, end_date)
@@ -74,12 +78,16 @@ class MetloomClient(BaseSnotelClient):
 
     def get_all_station_data(self, force_update: bool = False) -> DataFrame[AllSnotelDataSchema]:
         raise NotImplementedError(
-            "Metloom does not easily support a single bulk download for all station history. Use get_station_data in a parallel map."
+            "Metloom does not easily support a single bulk download for all station history. Use get_station_data_many instead."
         )
 
     def _fetch_and_cache_station_data(
         self, station_id: str, cache_path: Path, start_date: str | None, end_date: str | None
     ) -> pl.DataFrame:
+        # Deferred so importing snotel_lib does not pay for metloom unless this client fetches data
+        from metloom.pointdata import SnotelPointData
+        from metloom.variables import SnotelVariables
+
         logger.info(f"Fetching metloom data for {station_id}...")
 
         # Metloom uses 'name' optionally, we just need the code for instantiation.
@@ -134,7 +142,7 @@ class MetloomClient(BaseSnotelClient):
         df = cast_to_schema(df, SnotelDataSchema, column_map=STATION_DATA_COLUMN_MAP)
         df = df.sort([SnotelDataSchema.datetime])
 
-        df.write_parquet(cache_path)
+        write_cache_parquet(df, cache_path)
 
         return super()._filter_and_process(df, start_date, end_date)
 
@@ -2,6 +2,16 @@
 METADATA_CACHE_DAYS = 1
 STATION_CACHE_DAYS = 1
 
+# Parquet cache layout: small row groups let date-range scans skip data via min/max statistics
+CACHE_PARQUET_ROW_GROUP_SIZE = 8192
+CACHE_PARQUET_COMPRESSION_LEVEL = 3
+
+# Written next to validated caches; bump whenever a cached schema changes so old caches are re-validated
+CACHE_SCHEMA_VERSION = "1"
+
+# Concurrent station fetches, also used to size the HTTP connection pool
+MAX_CONCURRENT_REQUESTS = 16
+
 # Physical range bounds (metric)
 MIN_SNOW_DEPTH_M = 0.0
 MAX_SNOW_DEPTH_M = 10.0
@@ -6,6 +6,7 @@ from .core import (
     get_metloom_station_cache_path,
     read_validated_csv,
     read_validated_parquet,
+    write_cache_parquet,
 )
 
 __all__ = [
@@ -16,4 +17,5 @@ __all__ = [
     "get_metloom_station_cache_path",
     "read_validated_csv",
     "read_validated_parquet",
+    "write_cache_parquet",
 ]
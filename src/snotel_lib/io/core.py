@@ -6,6 +6,7 @@ import pandera.polars as pl_pa
 import polars as pl
 from platformdirs import user_cache_dir
 
+from ..constants import CACHE_PARQUET_COMPRESSION_LEVEL, CACHE_PARQUET_ROW_GROUP_SIZE
 from ..schemas import cast_to_schema
 
 DEFAULT_CACHE_DIR = Path(user_cache_dir(appname="snotel_data"))
@@ -75,3 +76,26 @@ def read_validated_parquet(
     """
     df = pl.read_parquet(source, **pl_read_kwargs)
     return cast_to_schema(df, schema, column_map=column_map)
+
+
+def write_cache_parquet(df: pl.DataFrame, path: Path) -> None:
+    """
+    Write a processed DataFrame to the Parquet cache.
+
+    Row groups are kept small and carry min/max statistics so lazy scans with
+    date (or station) predicates can skip row groups that fall outside the
+    requested range.  Frames should be sorted on the filter columns first so
+    those statistics are tight.
+
+    Args:
+        df: Processed DataFrame to cache.
+        path: Destination Parquet file.
+    """
+    df.write_parquet(
+        path,
+        compression="zstd",
+        compression_level=CACHE_PARQUET_COMPRESSION_LEVEL,
+        statistics=True,
+        row_group_size=CACHE_PARQUET_ROW_GROUP_SIZE,
+        use_pyarrow=False,
+    )
@@ -1,4 +1,4 @@
-from .converters import cast_to_schema, dtypes_from_schema
+from .converters import cast_to_schema, cast_to_schema_lazy, dtypes_from_schema
 from .models import AllSnotelDataSchema, SnotelDataSchema, StationMetadataSchema
 
 __all__ = [
@@ -6,5 +6,6 @@ __all__ = [
     "SnotelDataSchema",
     "StationMetadataSchema",
     "cast_to_schema",
+    "cast_to_schema_lazy",
     "dtypes_from_schema",
 ]
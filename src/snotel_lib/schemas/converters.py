@@ -39,17 +39,41 @@ def cast_to_schema(
     Returns:
         A validated ``pl.DataFrame`` conforming to *schema*.
     """
+    df = cast_to_schema_lazy(df.lazy(), schema, column_map=column_map).collect()
+    return typing.cast(pl.DataFrame, schema.validate(df))
+
+
+def cast_to_schema_lazy(
+    lf: pl.LazyFrame,
+    schema: type[pl_pa.DataFrameModel],
+    column_map: dict[str, str] | None = None,
+) -> pl.LazyFrame:
+    """
+    Lazy counterpart of ``cast_to_schema`` without the validation step.
+
+    The rename and casts are added to the query plan so they fuse with any
+    further lazy operations into a single pass on ``collect()``.  Callers are
+    responsible for validating the collected result against *schema*.
+
+    Args:
+        lf: Input LazyFrame with raw column names / dtypes.
+        schema: A pandera ``DataFrameModel`` subclass describing the desired output.
+        column_map: Optional ``{source_col: target_col}`` rename map applied before
+            casting.  Only columns present in ``lf`` are renamed.
+
+    Returns:
+        A ``pl.LazyFrame`` with renamed and cast columns.
+    """
     if column_map:
-        rename = {k: v for k, v in column_map.items() if k in df.columns}
-        if rename:
-            df = df.rename(rename)
+        lf = lf.rename(column_map, strict=False)
 
+    columns = lf.collect_schema().names()
     dtypes = dtypes_from_schema(schema)
-    cast_exprs = [pl.col(col).cast(dtype) for col, dtype in dtypes.items() if col in df.columns]
+    cast_exprs = [pl.col(col).cast(dtype) for col, dtype in dtypes.items() if col in columns]
     if cast_exprs:
-        df = df.with_columns(cast_exprs)
+        lf = lf.with_columns(cast_exprs)
 
-    return typing.cast(pl.DataFrame, schema.validate(df))
+    return lf
 
 
 def _extract_pl_dtype(annotation) -> pl.DataType | None:
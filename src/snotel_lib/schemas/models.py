@@ -28,18 +28,19 @@ class AllSnotelDataSchema(SnotelDataSchema):
 
 
 class StationMetadataSchema(pd_pa.DataFrameModel):
+    # Low-cardinality text columns are categorical so they are dictionary-encoded in memory and in Parquet
     station_id: Series[str] = pd_pa.Field()
     station_name: Series[str] = pd_pa.Field(nullable=True)
-    network: Series[str] = pd_pa.Field(nullable=True)
+    network: Series[pd_pa.Category] = pd_pa.Field(nullable=True)
     elevation_m: Series[float] = pd_pa.Field(nullable=True)
     latitude: Series[float] = pd_pa.Field(nullable=True)
     longitude: Series[float] = pd_pa.Field(nullable=True)
-    state: Series[str] = pd_pa.Field(nullable=True)
-    huc: Series[str] = pd_pa.Field(nullable=True)
-    mgrs: Series[str] = pd_pa.Field(nullable=True)
-    mountain_range: Series[str] = pd_pa.Field(nullable=True)
-    begin_date: Series[pd_pa.Date] = pd_pa.Field(nullable=True)
-    end_date: Series[pd_pa.Date] = pd_pa.Field(nullable=True)
+    state: Series[pd_pa.Category] = pd_pa.Field(nullable=True)
+    huc: Series[pd_pa.Category] = pd_pa.Field(nullable=True)
+    mgrs: Series[pd_pa.Category] = pd_pa.Field(nullable=True)
+    mountain_range: Series[pd_pa.Category] = pd_pa.Field(nullable=True)
+    begin_date: Series[pd_pa.DateTime] = pd_pa.Field(nullable=True)
+    end_date: Series[pd_pa.DateTime] = pd_pa.Field(nullable=True)
     csv_data: Series[bool] = pd_pa.Field(nullable=True)
     geometry: GeoSeries = pd_pa.Field(nullable=True)
 
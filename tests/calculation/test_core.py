@@ -113,6 +113,48 @@ def test_get_min_and_max_rows():
     assert result.loc["S1", "val"] == 10.0
 
 
+def test_get_min_and_max_rows_datetime64_end_date():
+    today = dt.date.today()
+
+    gdf = gpd.GeoDataFrame(
+        {
+            "code": ["S1", "S2", "S3"],
+            "end_date": pd.to_datetime([today, today - dt.timedelta(days=1), None]),
+            "val": [10.0, 20.0, 30.0],
+            "geometry": [Point(0, 0), Point(1, 1), Point(2, 2)],
+        }
+    ).set_index("code")
+    assert gdf["end_date"].dtype == "datetime64[ns]"
+
+    result = get_min_and_max_rows(gdf, "val")  # ty: ignore[invalid-argument-type]
+
+    # S3 has no end date and is treated as inactive
+    assert result.index.tolist() == ["S2", "S1"]
+
+    # No active station with a value to rank
+    gdf["val"] = [None, None, 30.0]
+    with pytest.raises(ValueError):
+        get_min_and_max_rows(gdf, "val")  # ty: ignore[invalid-argument-type]
+
+
+def test_get_min_and_max_rows_nullable_begin_date():
+    today = dt.date.today()
+
+    gdf = gpd.GeoDataFrame(
+        {
+            "code": ["S1", "S2", "S3", "S4"],
+            "end_date": pd.to_datetime([today, today, today, today - dt.timedelta(days=5)]),
+            "begin_date": pd.to_datetime(["1980-10-01", None, "2005-06-15", "1970-01-01"]),
+            "geometry": [Point(0, 0), Point(1, 1), Point(2, 2), Point(3, 3)],
+        }
+    ).set_index("code")
+
+    result = get_min_and_max_rows(gdf, "begin_date")  # ty: ignore[invalid-argument-type]
+
+    # S2's missing begin date is skipped and inactive S4 is excluded
+    assert result.index.tolist() == ["S3", "S1"]
+
+
 def test_accumulate_precip_by_water_year():
     # Test dates crossing water year boundary (Oct 1)
     # A single station's data
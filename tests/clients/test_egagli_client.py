@@ -1,10 +1,15 @@
 import io
 import json
 import lzma
+import os
 import tarfile
+from collections.abc import Callable
 
+import pandas as pd
+import polars as pl
 import pytest
 import requests
+import urllib3
 
 from snotel_lib import EgagliClient
 from snotel_lib.schemas import AllSnotelDataSchema, SnotelDataSchema, StationMetadataSchema
@@ -15,15 +20,29 @@ def test_client_init(tmp_path):
     assert client.cache_dir == tmp_path
 
 
+def test_is_cache_valid(tmp_path):
+    client = EgagliClient(cache_dir=tmp_path)
+    path = tmp_path / "cache.parquet"
+    assert not client._is_cache_valid(path, days=1)
+
+    path.touch()
+    assert client._is_cache_valid(path, days=1)
+
+    two_days_ago = path.stat().st_mtime - 2 * 86400
+    os.utime(path, (two_days_ago, two_days_ago))
+    assert not client._is_cache_valid(path, days=1)
+    assert client._is_cache_valid(path, days=3)
+
+
 def test_metadata_caching(mocker, tmp_path, mock_geojson):
     client = EgagliClient(cache_dir=tmp_path)
 
-    # Mock requests.get
+    # Mock requests.Session.get
     mock_response = mocker.Mock()
     # A minimal valid geojson for geopandas to read, including all schema columns
     mock_response.content = json.dumps(mock_geojson).encode()
     mock_response.status_code = 200
-    mocker.patch("requests.get", return_value=mock_response)
+    mocker.patch("requests.Session.get", return_value=mock_response)
 
     # First call - should hit mock
     metadata = client.get_stations_metadata()
@@ -34,23 +53,92 @@ def test_metadata_caching(mocker, tmp_path, mock_geojson):
         == "Rainier"
     )
     assert (tmp_path / "all_stations.parquet").exists()
+    assert isinstance(metadata[StationMetadataSchema.state].dtype, pd.CategoricalDtype)
+
+    cached = client.get_stations_metadata()
+    for col in ["network", "state", "huc", "mgrs", "mountain_range"]:
+        assert isinstance(cached[col].dtype, pd.CategoricalDtype)
+    assert cached[StationMetadataSchema.huc].iloc[0] == "12345"
+    assert cached[StationMetadataSchema.end_date].dtype == "datetime64[ns]"
+    assert cached[StationMetadataSchema.end_date].iloc[0] == pd.Timestamp("2023-01-01")
 
     assert (
-        requests.get.call_count if hasattr(requests.get, "call_count") else getattr(requests.get, "call_count", 1)
+        requests.Session.get.call_count
+        if hasattr(requests.Session.get, "call_count")
+        else getattr(requests.Session.get, "call_count", 1)
     ) == 1
 
 
+def test_metadata_cache_hit_skips_validation(mocker, tmp_path, mock_geojson):
+    client = EgagliClient(cache_dir=tmp_path)
+
+    mock_response = mocker.Mock()
+    mock_response.content = json.dumps(mock_geojson).encode()
+    mock_response.status_code = 200
+    mocker.patch("requests.Session.get", return_value=mock_response)
+
+    client.get_stations_metadata()
+    assert (tmp_path / "all_stations.ver").exists()
+
+    # Fresh clients read the parquet cache rather than the first client's in-memory copy
+    validate = mocker.spy(StationMetadataSchema, "validate")
+    cached = EgagliClient(cache_dir=tmp_path).get_stations_metadata()
+    assert validate.call_count == 0
+    assert "123" in cached[StationMetadataSchema.station_id].values
+
+    # A stale sidecar means the cache was written under an older schema
+    sidecar = tmp_path / "all_stations.ver"
+    stamp = sidecar.read_text()
+    sidecar.write_text("0" + stamp[stamp.index(":") :])
+    EgagliClient(cache_dir=tmp_path).get_stations_metadata()
+    assert validate.call_count == 1
+
+    # A parquet rewritten without refreshing the sidecar is not trusted either
+    sidecar.write_text(stamp)
+    cache_path = tmp_path / "all_stations.parquet"
+    cached.to_parquet(cache_path)
+    os.utime(cache_path, ns=(cache_path.stat().st_atime_ns, cache_path.stat().st_mtime_ns + 1))
+    EgagliClient(cache_dir=tmp_path).get_stations_metadata()
+    assert validate.call_count == 2
+
+
+def test_metadata_memoized_in_process(mocker, tmp_path, mock_geojson):
+    import geopandas as gpd
+
+    client = EgagliClient(cache_dir=tmp_path)
+
+    mock_response = mocker.Mock()
+    mock_response.content = json.dumps(mock_geojson).encode()
+    mock_response.status_code = 200
+    mocker.patch("requests.Session.get", return_value=mock_response)
+
+    first = client.get_stations_metadata()
+    first["extra"] = 1
+
+    read_parquet = mocker.spy(gpd, "read_parquet")
+    second = client.get_stations_metadata()
+    assert read_parquet.call_count == 0
+    assert "extra" not in second.columns
+
+    # Rewriting the cache file invalidates the in-memory copy
+    cache_path = tmp_path / "all_stations.parquet"
+    second.to_parquet(cache_path)
+    os.utime(cache_path, (cache_path.stat().st_atime, cache_path.stat().st_mtime + 1))
+    client.get_stations_metadata()
+    assert read_parquet.call_count == 1
+
+
 def test_station_data_caching(mocker, tmp_path, mock_station_csv):
     client = EgagliClient(cache_dir=tmp_path)
 
-    # Mock requests.get
+    # Mock requests.Session.get
     mock_response = mocker.Mock()
     # Now that we have a stricter schema, we must include all columns or accept NaNs if allowed
     # Our schema specifies swe_m, snow_depth_m, precip_m, tavg_c, tmin_c, tmax_c are required but nullable.
     # However, Pandera's DataFrameModel requires the column to exist if typed as Series[float].
     mock_response.content = mock_station_csv.encode()
     mock_response.status_code = 200
-    mocker.patch("requests.get", return_value=mock_response)
+    mocker.patch("requests.Session.get", return_value=mock_response)
 
     # First call
     df = client.get_station_data("679_WA_SNTL")
@@ -61,7 +149,9 @@ def test_station_data_caching(mocker, tmp_path, mock_station_csv):
     # Second call
     client.get_station_data("679_WA_SNTL")
     assert (
-        requests.get.call_count if hasattr(requests.get, "call_count") else getattr(requests.get, "call_count", 1)
+        requests.Session.get.call_count
+        if hasattr(requests.Session.get, "call_count")
+        else getattr(requests.Session.get, "call_count", 1)
     ) == 1
 
     # Test filtering
@@ -69,42 +159,288 @@ def test_station_data_caching(mocker, tmp_path, mock_station_csv):
     assert len(df_filtered) == 1
 
 
+def test_station_data_cache_hit_skips_processing(mocker, tmp_path, mock_station_csv):
+    client = EgagliClient(cache_dir=tmp_path)
+
+    mock_response = mocker.Mock()
+    mock_response.content = mock_station_csv.encode()
+    mock_response.status_code = 200
+    mocker.patch("requests.Session.get", return_value=mock_response)
+
+    process = mocker.spy(client, "_process_raw_polars_data")
+    client.get_station_data("679_WA_SNTL")
+    assert process.call_count == 1
+
+    # The cache already holds renamed, cast and accumulated data
+    df = client.get_station_data("679_WA_SNTL", start_date="2023-01-01")
+    assert process.call_count == 1
+    assert df.schema[SnotelDataSchema.swe_m] == pl.Float32
+
+
 def test_station_data_validation_failure(mocker, tmp_path):
     import polars.exceptions as ple
 
     client = EgagliClient(cache_dir=tmp_path)
 
-    # Mock requests.get with invalid data (wrong type for swe_m)
+    # Mock requests.Session.get with invalid data (wrong type for swe_m)
     mock_response = mocker.Mock()
     header = "datetime,WTEQ,SNWD,PRCPSA,TAVG,TMIN,TMAX"
     row = "2023-01-01,not_a_float,50,0,1,2,3"
     mock_response.content = f"{header}\n{row}".encode()
     mock_response.status_code = 200
-    mocker.patch("requests.get", return_value=mock_response)
+    mocker.patch("requests.Session.get", return_value=mock_response)
 
     with pytest.raises((ple.SchemaError, ple.ComputeError, ple.PolarsError)):
         client.get_station_data("INVALID_SNTL")
 
 
+def _station_tar(members: dict[str, bytes], compress: Callable[[bytes], bytes] = lzma.compress) -> bytes:
+    """Build an in-memory all-stations archive from `{member name: content}`."""
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:") as tar:
+        for name, content in members.items():
+            tarinfo = tarfile.TarInfo(name=name)
+            tarinfo.size = len(content)
+            tar.addfile(tarinfo, io.BytesIO(content))
+    return compress(buf.getvalue())
+
+
 def test_get_all_station_data(mocker, tmp_path):
     client = EgagliClient(cache_dir=tmp_path)
 
-    # Create a small tar.lzma in memory
-    buf = io.BytesIO()
-    with lzma.open(buf, "wb") as lzma_file:
-        with tarfile.open(fileobj=lzma_file, mode="w:") as tar:
-            csv_content = b"datetime,WTEQ,SNWD,PRCPSA,TAVG,TMIN,TMAX\n2023-01-01,100,50,,,,"
-            tarinfo = tarfile.TarInfo(name="679_WA_SNTL.csv")
-            tarinfo.size = len(csv_content)
-            tar.addfile(tarinfo, io.BytesIO(csv_content))
-
     mock_response = mocker.Mock()
-    mock_response.content = buf.getvalue()
+    mock_response.raw = io.BytesIO(
+        _station_tar({"679_WA_SNTL.csv": b"datetime,WTEQ,SNWD,PRCPSA,TAVG,TMIN,TMAX\n2023-01-01,100,50,,,,"})
+    )
     mock_response.status_code = 200
-    mocker.patch("requests.get", return_value=mock_response)
+    mocker.patch("requests.Session.get", return_value=mock_response)
 
     df = client.get_all_station_data()
+    mock_response.close.assert_called_once()
     assert AllSnotelDataSchema.station_id in df.columns
     assert df.select(AllSnotelDataSchema.station_id).item(0, 0) == "679_WA_SNTL"
     assert df.select(SnotelDataSchema.swe_m).item(0, 0) == 100
     assert (tmp_path / "all_station_data.parquet").exists()
+
+
+def test_get_all_station_data_memoized_in_process(mocker, tmp_path):
+    client = EgagliClient(cache_dir=tmp_path)
+
+    mock_response = mocker.Mock()
+    mock_response.raw = io.BytesIO(
+        _station_tar({"679_WA_SNTL.csv": b"datetime,WTEQ,SNWD,PRCPSA,TAVG,TMIN,TMAX\n2023-01-01,100,50,,,,"})
+    )
+    mocker.patch("requests.Session.get", return_value=mock_response)
+
+    first = client.get_all_station_data()
+    first.drop_in_place(SnotelDataSchema.swe_m)
+
+    read_parquet = mocker.spy(pl, "read_parquet")
+    second = client.get_all_station_data()
+    second.insert_column(0, pl.Series("extra", [1]))
+    assert read_parquet.call_count == 0
+    assert SnotelDataSchema.swe_m in second.columns
+
+    third = client.get_all_station_data()
+    assert "extra" not in third.columns
+    assert third.select(SnotelDataSchema.swe_m).item(0, 0) == 100
+
+
+def test_station_data_cache_hit_date_window(mocker, tmp_path):
+    client = EgagliClient(cache_dir=tmp_path)
+
+    header = "datetime,WTEQ,SNWD,PRCPSA,TAVG,TMIN,TMAX"
+    rows = [f"2023-01-0{day},{day},50,0,1,2,3" for day in range(1, 6)]
+    mock_response = mocker.Mock()
+    mock_response.content = "\n".join([header, *rows]).encode()
+    mock_response.status_code = 200
+    mocker.patch("requests.Session.get", return_value=mock_response)
+
+    client.get_station_data("679_WA_SNTL")
+
+    # Served from the parquet cache with only the requested window materialized
+    df = client.get_station_data("679_WA_SNTL", start_date="2023-01-02", end_date="2023-01-03")
+    assert df.columns == list(SnotelDataSchema.to_schema().columns)
+    assert df.get_column(SnotelDataSchema.swe_m).to_list() == [2.0, 3.0]
+
+
+class _NonSeekableStream(io.RawIOBase):
+    """Forward-only reader standing in for an HTTP response body."""
+
+    def __init__(self, data: bytes):
+        self._buf = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return False
+
+    def readinto(self, b):
+        return self._buf.readinto(b)
+
+
+def test_get_all_station_data_streams_tar(mocker, tmp_path):
+    client = EgagliClient(cache_dir=tmp_path)
+
+    members = {
+        "data/": b"",
+        **{
+            f"data/{station_id}.csv": f"datetime,WTEQ,SNWD,PRCPSA,TAVG,TMIN,TMAX\n2023-01-01,{swe},50,,,,".encode()
+            for station_id, swe in [("679_WA_SNTL", 100), ("1000_CO_SNTL", 200)]
+        },
+        "data/README.txt": b"not a station",
+    }
+
+    mock_response = mocker.Mock()
+    mock_response.raw = _NonSeekableStream(_station_tar(members))
+    mock_response.status_code = 200
+    mocker.patch("requests.Session.get", return_value=mock_response)
+
+    df = client.get_all_station_data()
+    assert sorted(df.get_column(AllSnotelDataSchema.station_id).to_list()) == ["1000_CO_SNTL", "679_WA_SNTL"]
+    assert df.filter(pl.col(AllSnotelDataSchema.station_id) == "1000_CO_SNTL").item(0, SnotelDataSchema.swe_m) == 200
+
+
+def test_get_all_station_data_skips_blank_lines(mocker, tmp_path):
+    client = EgagliClient(cache_dir=tmp_path)
+
+    csvs = {
+        "679_WA_SNTL": b"datetime,WTEQ,SNWD,PRCPSA,TAVG,TMIN,TMAX\n2023-01-01,1,50,,,,\n\n2023-01-02,2,50,,,,\n\n",
+        "1000_CO_SNTL": b"datetime,WTEQ,SNWD,PRCPSA,TAVG,TMIN,TMAX\n\n2023-01-01,3,60,,,,",
+    }
+    mock_response = mocker.Mock()
+    mock_response.raw = io.BytesIO(_station_tar({f"{station_id}.csv": content for station_id, content in csvs.items()}))
+    mocker.patch("requests.Session.get", return_value=mock_response)
+
+    df = client.get_all_station_data()
+    assert df.get_column(AllSnotelDataSchema.station_id).to_list() == ["1000_CO_SNTL", "679_WA_SNTL", "679_WA_SNTL"]
+    assert df.get_column(SnotelDataSchema.swe_m).to_list() == [3.0, 1.0, 2.0]
+
+
+def test_get_all_station_data_mismatched_headers(mocker, tmp_path):
+    client = EgagliClient(cache_dir=tmp_path)
+
+    csvs = {
+        "679_WA_SNTL": b"datetime,WTEQ,SNWD,PRCPSA,TAVG,TMIN,TMAX\n2023-01-01,100,50,,,,\n",
+        "1000_CO_SNTL": b"datetime,SNWD,WTEQ,PRCPSA,TAVG,TMIN,TMAX\r\n2023-01-01,60,200,,,,\r\n",
+    }
+    mock_response = mocker.Mock()
+    mock_response.raw = io.BytesIO(_station_tar({f"{station_id}.csv": content for station_id, content in csvs.items()}))
+    mock_response.status_code = 200
+    mocker.patch("requests.Session.get", return_value=mock_response)
+
+    df = client.get_all_station_data().sort(AllSnotelDataSchema.station_id)
+    assert df.get_column(SnotelDataSchema.swe_m).to_list() == [200.0, 100.0]
+    assert df.get_column(SnotelDataSchema.snow_depth_m).to_list() == [60.0, 50.0]
+
+
+def test_get_station_data_many(mocker, tmp_path, mock_station_csv):
+    client = EgagliClient(cache_dir=tmp_path)
+
+    mock_response = mocker.Mock()
+    mock_response.content = mock_station_csv.encode()
+    mock_response.status_code = 200
+    mock_get = mocker.patch("requests.Session.get", return_value=mock_response)
+
+    station_ids = ["679_WA_SNTL", "1000_CO_SNTL", "713_CO_SNTL"]
+    results = client.get_station_data_many([*station_ids, "679_WA_SNTL"], max_workers=2)
+
+    assert list(results) == station_ids
+    assert all(df.select(SnotelDataSchema.swe_m).item(0, 0) == 100 for df in results.values())
+    assert mock_get.call_count == 3
+    assert all((tmp_path / f"{station_id}.parquet").exists() for station_id in station_ids)
+
+
+def test_get_all_station_data_zstd_mirror(mocker, tmp_path):
+    zstandard = pytest.importorskip("zstandard")
+
+    mirror_url = "https://example.com/all_station_data.tar.zst"
+    client = EgagliClient(cache_dir=tmp_path, zstd_mirror_url=mirror_url)
+
+    mock_response = mocker.Mock()
+    mock_response.raw = io.BytesIO(
+        _station_tar(
+            {"679_WA_SNTL.csv": b"datetime,WTEQ,SNWD,PRCPSA,TAVG,TMIN,TMAX\n2023-01-01,100,50,,,,"},
+            compress=zstandard.ZstdCompressor().compress,
+        )
+    )
+    mock_get = mocker.patch("requests.Session.get", return_value=mock_response)
+
+    df = client.get_all_station_data()
+    assert mock_get.call_args.args == (mirror_url,)
+    assert df.select(SnotelDataSchema.swe_m).item(0, 0) == 100
+
+
+def test_get_all_station_data_zstd_mirror_fallback(mocker, tmp_path):
+    client = EgagliClient(cache_dir=tmp_path, zstd_mirror_url="https://example.com/missing.tar.zst")
+
+    missing = mocker.Mock()
+    missing.raise_for_status.side_effect = requests.HTTPError("404 Not Found")
+    upstream = mocker.Mock()
+    upstream.raw = io.BytesIO(
+        _station_tar({"679_WA_SNTL.csv": b"datetime,WTEQ,SNWD,PRCPSA,TAVG,TMIN,TMAX\n2023-01-01,100,50,,,,"})
+    )
+    mocker.patch(
+        "requests.Session.get", side_effect=lambda url, **_: upstream if url.endswith(".tar.lzma") else missing
+    )
+
+    df = client.get_all_station_data()
+    assert df.select(SnotelDataSchema.swe_m).item(0, 0) == 100
+    missing.close.assert_called_once()
+
+
+def test_get_all_station_data_corrupt_zstd_mirror_fallback(mocker, tmp_path):
+    pytest.importorskip("zstandard")
+
+    client = EgagliClient(cache_dir=tmp_path, zstd_mirror_url="https://example.com/corrupt.tar.zst")
+
+    corrupt = mocker.Mock()
+    corrupt.raw = io.BytesIO(b"this is not a zstd frame")
+    upstream = mocker.Mock()
+    upstream.raw = io.BytesIO(
+        _station_tar({"679_WA_SNTL.csv": b"datetime,WTEQ,SNWD,PRCPSA,TAVG,TMIN,TMAX\n2023-01-01,100,50,,,,"})
+    )
+    mocker.patch(
+        "requests.Session.get", side_effect=lambda url, **_: upstream if url.endswith(".tar.lzma") else corrupt
+    )
+
+    df = client.get_all_station_data()
+    assert df.select(SnotelDataSchema.swe_m).item(0, 0) == 100
+    corrupt.close.assert_called_once()
+    upstream.close.assert_called_once()
+
+
+class _ResettingStream(_NonSeekableStream):
+    """Serves the first `limit` bytes of `data`, then fails like a connection reset mid-body."""
+
+    def __init__(self, data: bytes, limit: int):
+        super().__init__(data[:limit])
+
+    def readinto(self, b):
+        n = super().readinto(b)
+        if not n:
+            raise urllib3.exceptions.ProtocolError("Connection broken: ConnectionResetError(104)")
+        return n
+
+
+def test_get_all_station_data_zstd_mirror_reset_fallback(mocker, tmp_path):
+    zstandard = pytest.importorskip("zstandard")
+
+    client = EgagliClient(cache_dir=tmp_path, zstd_mirror_url="https://example.com/flaky.tar.zst")
+
+    csvs = {
+        f"{station_id}.csv": b"datetime,WTEQ,SNWD,PRCPSA,TAVG,TMIN,TMAX\n" + b"2023-01-01,100,50,,,,\n" * 1000
+        for station_id in ("679_WA_SNTL", "1000_CO_SNTL")
+    }
+    mirror_body = _station_tar(csvs, compress=zstandard.ZstdCompressor().compress)
+    flaky = mocker.Mock()
+    flaky.raw = _ResettingStream(mirror_body, len(mirror_body) // 2)
+    upstream = mocker.Mock()
+    upstream.raw = io.BytesIO(_station_tar(csvs))
+    mocker.patch("requests.Session.get", side_effect=lambda url, **_: upstream if url.endswith(".tar.lzma") else flaky)
+
+    df = client.get_all_station_data()
+    assert df.get_column(AllSnotelDataSchema.station_id).n_unique() == 2
+    flaky.close.assert_called_once()
+    upstream.close.assert_called_once()
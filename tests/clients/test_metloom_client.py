@@ -1,3 +1,5 @@
+import json
+
 import pandas as pd
 import pytest
 
@@ -40,6 +42,24 @@ def test_metadata_caching(mocker, tmp_path):
     assert "123" in metadata[StationMetadataSchema.station_id].values
 
 
+def test_metadata_delegate_memoized(mocker, tmp_path, mock_geojson):
+    import geopandas as gpd
+
+    client = MetloomClient(cache_dir=tmp_path)
+
+    mock_response = mocker.Mock()
+    mock_response.content = json.dumps(mock_geojson).encode()
+    mocker.patch("requests.Session.get", return_value=mock_response)
+
+    client.get_stations_metadata()
+    read_parquet = mocker.spy(gpd, "read_parquet")
+    metadata = client.get_stations_metadata()
+
+    # Repeat calls reuse the same delegate, so its in-process memo serves them
+    assert read_parquet.call_count == 0
+    assert len(metadata) == len(mock_geojson["features"])
+
+
 def test_station_data_caching(mocker, tmp_path):
     client = MetloomClient(cache_dir=tmp_path)
 
@@ -66,7 +86,7 @@ def test_station_data_caching(mocker, tmp_path):
 
     mock_snotel_point = mocker.Mock()
     mock_snotel_point.get_daily_data.return_value = mock_gdf
-    mocker.patch("snotel_lib.clients.metloom_client.SnotelPointData", return_value=mock_snotel_point)
+    mocker.patch("metloom.pointdata.SnotelPointData", return_value=mock_snotel_point)
 
     # First call
     df = client.get_station_data("679:WA:SNTL")
@@ -10,8 +10,9 @@ from pandera.typing import Series
 from snotel_lib.io import (
     read_validated_csv,
     read_validated_parquet,
+    write_cache_parquet,
 )
-from snotel_lib.schemas import SnotelDataSchema, cast_to_schema, dtypes_from_schema
+from snotel_lib.schemas import SnotelDataSchema, cast_to_schema, cast_to_schema_lazy, dtypes_from_schema
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -118,6 +119,26 @@ class TestCastToSchema:
             cast_to_schema(raw, StrictSchema)
 
 
+# ---------------------------------------------------------------------------
+# cast_to_schema_lazy
+# ---------------------------------------------------------------------------
+
+
+class TestCastToSchemaLazy:
+    def test_returns_lazy_frame_with_casts(self):
+        raw = _make_raw_df().rename({"swe_m": "WTEQ"})
+        lf = cast_to_schema_lazy(raw.lazy(), SnotelDataSchema, column_map={"WTEQ": SnotelDataSchema.swe_m})
+        assert isinstance(lf, pl.LazyFrame)
+
+        result = lf.collect()
+        assert "WTEQ" not in result.columns
+        assert result.schema[SnotelDataSchema.swe_m] == pl.Float32
+
+    def test_ignores_unmapped_columns(self):
+        lf = cast_to_schema_lazy(_make_raw_df().lazy(), SnotelDataSchema, column_map={"SNWD": "snow_depth_m"})
+        assert lf.collect().columns == _make_raw_df().columns
+
+
 # ---------------------------------------------------------------------------
 # read_validated_csv
 # ---------------------------------------------------------------------------
@@ -164,3 +185,25 @@ class TestReadValidatedParquet:
         result = read_validated_parquet(pq_path, SnotelDataSchema)
         assert result.height == 2
         assert result.schema[SnotelDataSchema.swe_m] == pl.Float32
+
+
+# ---------------------------------------------------------------------------
+# write_cache_parquet
+# ---------------------------------------------------------------------------
+
+
+class TestWriteCacheParquet:
+    def test_writes_row_group_statistics(self, tmp_path):
+        import pyarrow.parquet as pq
+
+        typed = cast_to_schema(_make_raw_df(), SnotelDataSchema)
+        pq_path = tmp_path / "cache.parquet"
+        write_cache_parquet(typed, pq_path)
+
+        metadata = pq.ParquetFile(pq_path).metadata
+        dt_idx = typed.columns.index(SnotelDataSchema.datetime)
+        stats = metadata.row_group(0).column(dt_idx).statistics
+        assert stats.has_min_max
+        assert (stats.min, stats.max) == (date(2024, 1, 1), date(2024, 1, 2))
+        assert metadata.row_group(0).column(dt_idx).compression == "ZSTD"
+        assert pl.read_parquet(pq_path).equals(typed)